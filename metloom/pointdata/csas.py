@@ -33,6 +33,7 @@ class CSASMet(CSVPointData):
 
     # Data is in Mountain time
     UTC_OFFSET_HOURS = -7
+    DATETIME_COLUMNS = ['Year', 'DOY', 'Hour']
 
     URL = "https://snowstudies.org/wp-content/uploads/"
     DATASOURCE = "CSAS"
@@ -2,12 +2,14 @@
 Location to keep readers that pull in a flat file like a csv.
 """
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 
 from metloom.pointdata import PointData
 from metloom.variables import SensorDescription
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
 import logging
@@ -71,7 +73,9 @@ class StationInfo(Enum):
         return result
 
     @property
+    @lru_cache(maxsize=None)
     def point(self):
+        # Members are singletons, so each point is only built once
         return gpd.points_from_xy([self.longitude],
                                   [self.latitude],
                                   [self.elevation])[0]
@@ -84,6 +88,11 @@ class CSVPointData(PointData):
     """
     ALLOWED_STATIONS = StationInfo
     UTC_OFFSET_HOURS = 0  # Allows users to specificy the timezone of the datasets
+    # Columns _assign_datetime needs. When set, only these and the requested
+    # variable columns are parsed from the csv files
+    DATETIME_COLUMNS = None
+    # Most files downloaded at the same time
+    MAX_DOWNLOAD_WORKERS = 8
 
     def __init__(self, station_id, name=None, metadata=None, cache='./cache'):
         """
@@ -131,20 +140,24 @@ class CSVPointData(PointData):
         raise NotImplementedError('CSVPointData._assign_datetime() must be implemented '
                                   'to download csv station data.')
 
+    def _download_file(self, url):
+        """Download one file to the cache if it isn't there already"""
+        filename = self._cache.joinpath(Path(url).name)
+        if not filename.exists():
+            with requests.get(url, stream=True) as r:
+                LOG.info(f'Downloading {Path(url).name}...')
+                lines = r.iter_lines()
+                with open(filename, mode='w+') as fp:
+                    for line in lines:
+                        fp.write(line.decode('utf-8') + '\n')
+        return filename
+
     def _download(self, urls):
         """Download the file(s)"""
-        filenames = []
-        for url in urls:
-            filename = self._cache.joinpath(Path(url).name)
-            filenames.append(filename)
-            if not filename.exists():
-                with requests.get(url, stream=True) as r:
-                    LOG.info(f'Downloading {Path(url).name}...')
-                    lines = r.iter_lines()
-                    with open(filename, mode='w+') as fp:
-                        for line in lines:
-                            fp.write(line.decode('utf-8') + '\n')
-        return filenames
+        # Files are independent, so fetch them at the same time
+        workers = max(1, min(self.MAX_DOWNLOAD_WORKERS, len(urls)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._download_file, urls))
 
     def _get_one_variable(self, resp_df, period, variable: SensorDescription):
         """
@@ -187,7 +200,16 @@ class CSVPointData(PointData):
 
         # Download data if it doesn't exist locally.
         files = self._download(urls)
-        dfs = [pd.read_csv(f, index_col=False, low_memory=False) for f in files]
+        if self.DATETIME_COLUMNS is None:
+            usecols = None
+        else:
+            columns = {*self.DATETIME_COLUMNS, *(v.code for v in variables)}
+
+            def usecols(column):
+                # Requested columns a file lacks are skipped rather than raising
+                return column in columns
+        dfs = [pd.read_csv(f, index_col=False, low_memory=False, usecols=usecols)
+               for f in files]
         resp_df = pd.concat(dfs)
         resp_df = self._assign_datetime(resp_df)
 
@@ -203,7 +225,7 @@ class CSVPointData(PointData):
             df_var = self._get_one_variable(isolated, period, variable)
             if df_var is not None:
                 if not np.all(df_var.isnull()):
-                    df[variable.name].loc[df_var.index] = df_var
+                    df.loc[df_var.index, variable.name] = df_var
                     df[f"{variable.name}_units"] = variable.units
             else:
                 df = df.drop(columns=[variable.name])
@@ -1,10 +1,20 @@
 from datetime import datetime
+from functools import lru_cache
 import pandas as pd
 import zeep
 
 from metloom.request_utils import no_ssl_verification
 
 
+@lru_cache(maxsize=None)
+def _get_client(url):
+    """
+    Build the SOAP client for a WSDL url. Building a client downloads and
+    parses the WSDL, which is slow, so one client is shared per url.
+    """
+    return zeep.Client(url)
+
+
 class BaseSnotelClient:
     """
     Base snotel client class. Used for interacting with SNOTEL SOAP client.
@@ -70,9 +80,7 @@ class BaseSnotelClient:
         Make the request to the SOAP client for the implemented service.
         """
         with no_ssl_verification():
-            client = zeep.Client(
-                cls.URL,
-            )
+            client = _get_client(cls.URL)
             service = getattr(client.service, cls.SERVICE_NAME)
             response = service(**params)
         return response
@@ -31,6 +31,7 @@ class SnowExMet(CSVPointData):
 
     # Data is in UTC
     UTC_OFFSET_HOURS = 0
+    DATETIME_COLUMNS = ['TIMESTAMP']
 
     URL = "https://n5eil01u.ecs.nsidc.org/SNOWEX/SNEX_Met.001/"
     DATASOURCE = "NSIDC"
@@ -1,4 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
+from functools import partial
 from typing import List
 import geopandas as gpd
 import numpy as np
@@ -14,6 +16,9 @@ from ..variables import USGSVariables, SensorDescription
 from ..dataframe_utils import merge_df, append_df, resample_whole_df
 
 LOG = logging.getLogger(__name__)
+# Shared so repeated requests to USGS reuse open connections. Only used from
+# the calling thread; search worker threads open their own sessions
+SESSION = requests.Session()
 
 
 class USGSPointData(PointData):
@@ -31,6 +36,8 @@ class USGSPointData(PointData):
     USGS_URL = "https://waterservices.usgs.gov/nwis/"
     META_URL = USGS_URL + "site/"
     DATASOURCE = "USGS"
+    # max concurrent station searches in points_from_geometry
+    MAX_SEARCH_WORKERS = 8
 
     def __init__(self, station_id, name, metadata=None, duration=None):
         """
@@ -192,9 +199,14 @@ class USGSPointData(PointData):
         no_data_value = response_data["variable"]["noDataValue"]
         units = response_data["variable"]["unit"]["unitCode"]
 
-        sensor_df = gpd.GeoDataFrame.from_dict(
-            response_data["values"][0]["value"],
-            geometry=[self.metadata] * len(response_data["values"][0]["value"]),
+        # build the frame from columns rather than from a dict per row
+        values = response_data["values"][0]["value"]
+        sensor_df = gpd.GeoDataFrame(
+            {
+                "dateTime": [v["dateTime"] for v in values],
+                "value": [v["value"] for v in values],
+            },
+            geometry=[self.metadata] * len(values),
         )
 
         if sensor_df.empty:
@@ -367,7 +379,7 @@ class USGSPointData(PointData):
         return self._get_data(start_date, end_date, variables, ["iv"])
 
     @staticmethod
-    def _get_url_response(url, params=None, parse='text'):
+    def _get_url_response(url, params=None, parse='text', session=None):
         """
         Get url response from USGS
 
@@ -375,15 +387,13 @@ class USGSPointData(PointData):
             url: url with formed query parameters
             params: optional dict of additional url call parameters
             parse: parsing format, either 'text' or 'json'
+            session: optional requests.Session to use instead of SESSION
 
         Returns:
             response: DataFrame with query results
         """
         result = []
-        if params:
-            resp = requests.get(url, params)
-        else:
-            resp = requests.get(url)
+        resp = (session or SESSION).get(url, params=params)
 
         if resp.status_code != 200:
             if resp.status_code == 404:
@@ -412,7 +422,8 @@ class USGSPointData(PointData):
 
     @classmethod
     def _station_sensor_search(
-        cls, meta_url, bounds, sensor: SensorDescription, dur="dv,iv", buffer=0.0
+        cls, meta_url, bounds, sensor: SensorDescription, dur="dv,iv", buffer=0.0,
+        session=None
     ):
         """
         Search for USGS stations within a bounding box for the given sensor description.
@@ -423,6 +434,7 @@ class USGSPointData(PointData):
             sensor: SensorDescription object
             dur: duration ("dv" or "iv")
             buffer: float of lat/lon degrees, buffer for bounding box
+            session: optional requests.Session to make the request with
         """
         result = []
         bounds = bounds.round(decimals=5)
@@ -436,7 +448,7 @@ class USGSPointData(PointData):
             f'{maxy}&siteStatus=active&hasDataTypeCd={dur}&parameterCd={sensor.code}'
         )
 
-        response = cls._get_url_response(url, parse='text')
+        response = cls._get_url_response(url, parse='text', session=session)
 
         if len(response):
             result = pd.read_csv(
@@ -469,13 +481,27 @@ class USGSPointData(PointData):
         bounds = projected_geom.bounds.iloc[0]
         search_df = None
         station_search_kwargs = {}
+        search = partial(
+            cls._station_sensor_search, cls.META_URL, bounds,
+            buffer=kwargs["buffer"], **station_search_kwargs
+        )
 
-        for variable in variables:
-            result_df = cls._station_sensor_search(
-                cls.META_URL, bounds, variable, buffer=kwargs["buffer"],
-                **station_search_kwargs
-            )
+        if len(variables) > 1:
+            # Each variable is a separate request, so run the searches
+            # together. requests.Session is not documented as thread safe, so
+            # each search opens and closes its own. map keeps the results in
+            # the order of variables
+            def threaded_search(variable):
+                with requests.Session() as session:
+                    return search(variable, session=session)
+
+            n_workers = min(len(variables), cls.MAX_SEARCH_WORKERS)
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                results = list(executor.map(threaded_search, variables))
+        else:
+            results = [search(variable) for variable in variables]
 
+        for result_df in results:
             if len(result_df):
                 result_df["index_id"] = result_df["site_no"]
                 result_df.set_index("index_id", inplace=True)
@@ -1 +1 @@
-"""Unit test package for dataloom."""
+"""Unit test package for metloom."""
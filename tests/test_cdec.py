@@ -1,5 +1,5 @@
 from datetime import timezone, timedelta, datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 import re
 
 import geopandas as gpd
@@ -9,128 +9,177 @@ import pytest
 import shapely
 from pandas import Timestamp
 from pathlib import Path
+from types import SimpleNamespace
 
 from metloom.pointdata import CDECPointData, PointDataCollection
 from metloom.variables import CdecStationVariables
 from tests.test_point_data import BasePointDataTest, side_effect_error
+from tests.utils import read_text
+
+
+CDEC_MOCKS_DIR = Path(__file__).parent.joinpath("data/cdec_mocks")
+
+# Mocked JSONDataServlet responses, shared by every test in this module
+CDEC_DAILY_PRECIP_RESPONSE = (
+    {
+        "stationId": "TNY",
+        "durCode": "D",
+        "SENSOR_NUM": 2,
+        "sensorType": "SNOW WC",
+        "date": "2021-5-16 00:00",
+        "obsDate": "2021-5-16 00:00",
+        "value": -0.11,
+        "dataFlag": " ",
+        "units": "INCHES",
+    },
+    {
+        "stationId": "TNY",
+        "durCode": "D",
+        "SENSOR_NUM": 2,
+        "sensorType": "SNOW WC",
+        "date": "2021-5-17 00:00",
+        "obsDate": "2021-5-17 00:00",
+        "value": -0.10,
+        "dataFlag": " ",
+        "units": "INCHES",
+    },
+    {
+        "stationId": "TNY",
+        "durCode": "D",
+        "SENSOR_NUM": 2,
+        "sensorType": "SNOW WC",
+        "date": "2021-5-18 00:00",
+        "obsDate": "2021-5-18 00:00",
+        "value": -0.10,
+        "dataFlag": " ",
+        "units": "INCHES",
+    },
+)
+
+CDEC_DAILY_TEMP_RESPONSE = (
+    {
+        "stationId": "TNY",
+        "durCode": "D",
+        "SENSOR_NUM": 30,
+        "sensorType": "SNOW WC",
+        "date": "2021-5-15 00:00",
+        "obsDate": "2021-5-15 00:00",
+        "value": 2.1,
+        "dataFlag": " ",
+        "units": "DEG F",
+    },
+    {
+        "stationId": "TNY",
+        "durCode": "D",
+        "SENSOR_NUM": 30,
+        "sensorType": "SNOW WC",
+        "date": "2021-5-17 00:00",
+        "obsDate": "2021-5-17 00:00",
+        "value": 2.4,
+        "dataFlag": " ",
+        "units": "DEG F",
+    },
+    {
+        "stationId": "TNY",
+        "durCode": "D",
+        "SENSOR_NUM": 30,
+        "sensorType": "SNOW WC",
+        "date": "2021-5-18 00:00",
+        "obsDate": "2021-5-18 00:00",
+        "value": 2.2,
+        "dataFlag": " ",
+        "units": "DEG F",
+    },
+)
+
+CDEC_HOURLY_TEMP_RESPONSE = (
+    {
+        "stationId": "TNY",
+        "durCode": "D",
+        "SENSOR_NUM": 30,
+        "sensorType": "SNOW WC",
+        "date": "2021-5-15 00:00",
+        "obsDate": "2021-5-15 00:00",
+        "value": 2.1,
+        "dataFlag": " ",
+        "units": "DEG F",
+    },
+    {
+        "stationId": "TNY",
+        "durCode": "D",
+        "SENSOR_NUM": 30,
+        "sensorType": "SNOW WC",
+        "date": "2021-5-15 01:00",
+        "obsDate": "2021-5-15 01:00",
+        "value": 2.4,
+        "dataFlag": " ",
+        "units": "DEG F",
+    },
+    {
+        "stationId": "TNY",
+        "durCode": "D",
+        "SENSOR_NUM": 30,
+        "sensorType": "SNOW WC",
+        "date": "2021-5-15 03:00",
+        "obsDate": "2021-5-15 03:00",
+        "value": 2.2,
+        "dataFlag": " ",
+        "units": "DEG F",
+    },
+)
+
+CDEC_JSON_RESPONSES = {
+    "daily_precip": CDEC_DAILY_PRECIP_RESPONSE,
+    "daily_temp": CDEC_DAILY_TEMP_RESPONSE,
+    "hourly_temp": CDEC_HOURLY_TEMP_RESPONSE,
+    "empty": (),
+}
+
+
+def cdec_mock_response(kind):
+    """
+    Build a fresh mocked requests response for a kind of CDEC request, so
+    no call history is shared between tests. Only the payloads are shared
+    """
+    if kind == "metadata":
+        text = read_text(CDEC_MOCKS_DIR.joinpath("raw_tny_locations.csv"))
+        return SimpleNamespace(text=text, raise_for_status=lambda: None)
+    data = CDEC_JSON_RESPONSES[kind]
+    return SimpleNamespace(
+        json=lambda: list(data), raise_for_status=lambda: None
+    )
 
 
-class TestCDECStation(BasePointDataTest):
-    CDEC_MOCKS_DIR = Path(__file__).parent.joinpath("data/cdec_mocks")
+def cdec_get_side_effect(url, params=None, force_hourly=False):
+    """
+    Mock out requests.get for CDEC metadata and JSON data requests
 
-    @staticmethod
-    def cdec_daily_precip_response():
-        return [
-            {
-                "stationId": "TNY",
-                "durCode": "D",
-                "SENSOR_NUM": 2,
-                "sensorType": "SNOW WC",
-                "date": "2021-5-16 00:00",
-                "obsDate": "2021-5-16 00:00",
-                "value": -0.11,
-                "dataFlag": " ",
-                "units": "INCHES",
-            },
-            {
-                "stationId": "TNY",
-                "durCode": "D",
-                "SENSOR_NUM": 2,
-                "sensorType": "SNOW WC",
-                "date": "2021-5-17 00:00",
-                "obsDate": "2021-5-17 00:00",
-                "value": -0.10,
-                "dataFlag": " ",
-                "units": "INCHES",
-            },
-            {
-                "stationId": "TNY",
-                "durCode": "D",
-                "SENSOR_NUM": 2,
-                "sensorType": "SNOW WC",
-                "date": "2021-5-18 00:00",
-                "obsDate": "2021-5-18 00:00",
-                "value": -0.10,
-                "dataFlag": " ",
-                "units": "INCHES",
-            },
-        ]
+    Args:
+        url: requested url
+        params: request params
+        force_hourly: return no daily data to force a resample of hourly data
+    """
+    if params:
+        dur_code = params.get("dur_code")
+        if dur_code == "H":
+            kind = "hourly_temp"
+        elif dur_code == "D" and force_hourly:
+            kind = "empty"
+        elif dur_code == "D" and params.get("SensorNums") == "2":
+            kind = "daily_precip"
+        elif dur_code == "D" and params.get("SensorNums") == "30":
+            kind = "daily_temp"
+        else:
+            raise NotImplementedError("Not implemented")
+    # return the metadata
+    elif "CSVMetaDataServlet" in url:
+        kind = "metadata"
+    else:
+        kind = "empty"
+    return cdec_mock_response(kind)
 
-    @staticmethod
-    def cdec_daily_temp_response():
-        return [
-            {
-                "stationId": "TNY",
-                "durCode": "D",
-                "SENSOR_NUM": 30,
-                "sensorType": "SNOW WC",
-                "date": "2021-5-15 00:00",
-                "obsDate": "2021-5-15 00:00",
-                "value": 2.1,
-                "dataFlag": " ",
-                "units": "DEG F",
-            },
-            {
-                "stationId": "TNY",
-                "durCode": "D",
-                "SENSOR_NUM": 30,
-                "sensorType": "SNOW WC",
-                "date": "2021-5-17 00:00",
-                "obsDate": "2021-5-17 00:00",
-                "value": 2.4,
-                "dataFlag": " ",
-                "units": "DEG F",
-            },
-            {
-                "stationId": "TNY",
-                "durCode": "D",
-                "SENSOR_NUM": 30,
-                "sensorType": "SNOW WC",
-                "date": "2021-5-18 00:00",
-                "obsDate": "2021-5-18 00:00",
-                "value": 2.2,
-                "dataFlag": " ",
-                "units": "DEG F",
-            },
-        ]
 
-    @staticmethod
-    def cdec_hourly_temp_response():
-        return [
-            {
-                "stationId": "TNY",
-                "durCode": "D",
-                "SENSOR_NUM": 30,
-                "sensorType": "SNOW WC",
-                "date": "2021-5-15 00:00",
-                "obsDate": "2021-5-15 00:00",
-                "value": 2.1,
-                "dataFlag": " ",
-                "units": "DEG F",
-            },
-            {
-                "stationId": "TNY",
-                "durCode": "D",
-                "SENSOR_NUM": 30,
-                "sensorType": "SNOW WC",
-                "date": "2021-5-15 01:00",
-                "obsDate": "2021-5-15 01:00",
-                "value": 2.4,
-                "dataFlag": " ",
-                "units": "DEG F",
-            },
-            {
-                "stationId": "TNY",
-                "durCode": "D",
-                "SENSOR_NUM": 30,
-                "sensorType": "SNOW WC",
-                "date": "2021-5-15 03:00",
-                "obsDate": "2021-5-15 03:00",
-                "value": 2.2,
-                "dataFlag": " ",
-                "units": "DEG F",
-            },
-        ]
+class TestCDECStation(BasePointDataTest):
 
     @pytest.fixture(scope="function")
     def tny_station(self, mock_get):
@@ -146,70 +195,25 @@ class TestCDECStation(BasePointDataTest):
 
     @pytest.fixture(scope="class")
     def tny_daily_expected(self, expected_points):
-        df = gpd.GeoDataFrame.from_dict(
-            [
-                {
-                    "datetime": pd.Timestamp("2021-05-15 08:00:00+0000",
-                                             tz="UTC"),
-                    "ACCUMULATED PRECIPITATION": np.nan,
-                    "ACCUMULATED PRECIPITATION_units": np.nan,
-                    "AVG AIR TEMP": 2.1,
-                    "AVG AIR TEMP_units": "DEG F",
-                    "site": "TNY",
-                    "datasource": "CDEC"
-                },
-                {
-                    "datetime": pd.Timestamp("2021-05-16 08:00:00+0000", tz="UTC"),
-                    "ACCUMULATED PRECIPITATION": -0.11,
-                    "ACCUMULATED PRECIPITATION_units": "INCHES",
-                    "AVG AIR TEMP": np.nan,
-                    "AVG AIR TEMP_units": np.nan,
-                    "site": "TNY",
-                    "datasource": "CDEC"
-                },
-                {
-                    "datetime": pd.Timestamp("2021-05-17 08:00:00+0000", tz="UTC"),
-                    "ACCUMULATED PRECIPITATION": -0.10,
-                    "ACCUMULATED PRECIPITATION_units": "INCHES",
-                    "AVG AIR TEMP": 2.4,
-                    "AVG AIR TEMP_units": "DEG F",
-                    "site": "TNY",
-                    "datasource": "CDEC"
-                },
-                {
-                    "datetime": pd.Timestamp("2021-05-18 08:00:00+0000", tz="UTC"),
-                    "ACCUMULATED PRECIPITATION": -0.10,
-                    "ACCUMULATED PRECIPITATION_units": "INCHES",
-                    "AVG AIR TEMP": 2.2,
-                    "AVG AIR TEMP_units": "DEG F",
-                    "site": "TNY",
-                    "datasource": "CDEC"
-                },
-            ],
-            geometry=[expected_points[0]] * 4,
+        datetimes = pd.to_datetime(
+            ["2021-05-15", "2021-05-16", "2021-05-17", "2021-05-18"], utc=True
+        ) + pd.Timedelta(hours=8)
+        index = pd.MultiIndex.from_arrays(
+            [datetimes, ["TNY"] * 4], names=["datetime", "site"]
         )
-        # needed to reorder the columns for the pd testing compare
-        df = df.filter(
-            [
-                "datetime",
-                "geometry",
-                "site",
-                "measurementDate",
-                "ACCUMULATED PRECIPITATION",
-                "ACCUMULATED PRECIPITATION_units",
-                "AVG AIR TEMP",
-                "AVG AIR TEMP_units",
-                "datasource"
-            ]
+        return gpd.GeoDataFrame(
+            {
+                "ACCUMULATED PRECIPITATION": [np.nan, -0.11, -0.10, -0.10],
+                "ACCUMULATED PRECIPITATION_units": [
+                    np.nan, "INCHES", "INCHES", "INCHES"
+                ],
+                "AVG AIR TEMP": [2.1, np.nan, 2.4, 2.2],
+                "AVG AIR TEMP_units": ["DEG F", np.nan, "DEG F", "DEG F"],
+                "datasource": ["CDEC"] * 4,
+            },
+            geometry=[expected_points[0]] * 4,
+            index=index,
         )
-        df.set_index(keys=["datetime", "site"], inplace=True)
-        return df
-
-    @classmethod
-    def tny_meta_return(cls):
-        with open(cls.CDEC_MOCKS_DIR.joinpath("raw_tny_locations.csv"), "r") as fp:
-            lines = fp.readlines()
-        return "".join(lines)
 
     def read_html_side_effect(self, url, **kwargs):
         if "dynamicapp/staSearch" in url:
@@ -225,44 +229,16 @@ class TestCDECStation(BasePointDataTest):
 
     @classmethod
     def get_side_effect(cls, url, **kwargs):
-        mock = MagicMock()
-        params = kwargs.get("params")
-        if params:
-            if params.get("dur_code") == "D" and params.get('SensorNums') == "2":
-                mock.json.return_value = cls.cdec_daily_precip_response()
-            elif params.get("dur_code") == "D" and params.get('SensorNums') == "30":
-                mock.json.return_value = cls.cdec_daily_temp_response()
-            elif params.get("dur_code") == 'H':
-                mock.json.return_value = cls.cdec_hourly_temp_response()
-            else:
-                raise NotImplementedError("Not implemented")
-        # return the metadata
-        elif "CSVMetaDataServlet" in url:
-            mock.text = cls.tny_meta_return()
-        else:
-            mock.json.return_value = []
-        return mock
+        return cdec_get_side_effect(url, params=kwargs.get("params"))
 
     @classmethod
     def get_side_effect_just_hourly(cls, url, **kwargs):
         """
         Mock to force an hourly return for testing resample
         """
-        mock = MagicMock()
-        params = kwargs.get("params")
-        if params:
-            if params.get("dur_code") == 'D':
-                mock.json.return_value = []
-            elif params.get("dur_code") == 'H':
-                mock.json.return_value = cls.cdec_hourly_temp_response()
-            else:
-                raise NotImplementedError("Not implemented")
-        # return the metadata
-        elif "CSVMetaDataServlet" in url:
-            mock.text = cls.tny_meta_return()
-        else:
-            mock.json.return_value = []
-        return mock
+        return cdec_get_side_effect(
+            url, params=kwargs.get("params"), force_hourly=True
+        )
 
     @pytest.fixture()
     def mock_get(self):
@@ -24,7 +24,7 @@ from unittest.mock import patch, MagicMock
 import requests
 
 
-DATA_DIR = str(Path(__file__).parent.joinpath("data/csas_mocks"))
+DATA_DIR = Path(__file__).parent.joinpath("data/csas_mocks")
 
 # Convenient Dates for testing
 DT_20090301 = datetime(2009, 3, 1)
@@ -35,12 +35,20 @@ DT_20230601 = datetime(2023, 6, 1)
 DT_20230615 = datetime(2023, 6, 15)
 
 
+class Datetime2024(datetime):
+    """ datetime whose today() is always Jan 1 2024 """
+
+    @classmethod
+    def today(cls):
+        return cls(2024, 1, 1)
+
+
 class TestCSASMet:
 
     @classmethod
     def get_side_effect(cls, *args, **kwargs):
         url = Path(args[0])
-        local_path = Path(__file__).parent.joinpath(DATA_DIR).joinpath(url.name)
+        local_path = DATA_DIR.joinpath(url.name)
 
         obj = MagicMock()
         with open(local_path, 'rb') as f:
@@ -60,22 +68,28 @@ class TestCSASMet:
     def copy_files(self, urls):
         files = []
         for url in urls:
-            file = Path(DATA_DIR).joinpath(Path(url).name)
+            file = DATA_DIR.joinpath(Path(url).name)
             cache = Path(__file__).parent.joinpath('cache')
             shutil.copy(file, cache.joinpath(file.name))
             files.append(file)
         return files
 
     @pytest.fixture(scope='function')
-    def cache_dir(self):
-        """Cachae dir where data is being downloaded to"""
-        cache = Path(__file__).parent.joinpath('cache')
-        yield cache
-        if cache.is_dir():
-            shutil.rmtree(cache)
+    def cache_dir(self, tmp_path):
+        """Cache dir where data is being downloaded to"""
+        return tmp_path
+
+    @pytest.fixture(scope='class')
+    def mocked_today(self):
+        """
+        Pin today to 2024 so the latest SASP/SBSP file is the mocked
+        2010-2023 one
+        """
+        with patch("metloom.pointdata.csas.datetime", Datetime2024):
+            yield
 
     @pytest.fixture(scope='function')
-    def station(self, mocked_requests, cache_dir, station_id):
+    def station(self, mocked_requests, mocked_today, cache_dir, station_id):
         pnt = CSASMet(station_id, cache=cache_dir)
         yield pnt
 
@@ -102,7 +116,7 @@ class TestCSASMet:
         ('PTSP', datetime(2010, 1, 1), datetime(2010, 1, 2), ["PTSP_1hr.csv"]),
         ('SBSG', datetime(2010, 1, 1), datetime(2010, 1, 2), ["SBSG_1hr.csv"])
     ])
-    def test_file_urls(self, station_id, start, end, expected):
+    def test_file_urls(self, mocked_today, station_id, start, end, expected):
         pnt = CSASMet(station_id)
         pnt._verify_station()
         urls = pnt._file_urls(station_id, start, end)
@@ -117,7 +131,7 @@ class TestCSASMet:
         ('SBSP', datetime(2010, 1, 1),
          datetime(2024, 1, 1))
     ])
-    def test_file_urls_exception(self, station_id, start, end):
+    def test_file_urls_exception(self, mocked_today, station_id, start, end):
         """
         With files there are hard timeframes, test ane exception is raised when
         this is the case
@@ -168,6 +182,20 @@ class TestCSASMet:
         assert df.index.get_level_values('datetime').inferred_freq == 'D'
         assert df[variable.name].mean() == pytest.approx(expected_mean, abs=1e-5)
 
+    @pytest.mark.parametrize('station_id', ['SASP'])
+    def test_download_straddled_files(self, station, cache_dir, mocked_requests):
+        """ Check both files are downloaded when a request spans them """
+        station._verify_station()
+        urls = station._file_urls('SASP', DT_20090301, DT_20230315)
+        files = station._download(urls)
+
+        assert [f.name for f in files] == [
+            'SASP_1hr_2003-2009.csv', 'SASP_1hr_2010-2023.csv'
+        ]
+        assert all(f.parent == cache_dir and f.exists() for f in files)
+        requested = [c.args[0] for c in mocked_requests.call_args_list]
+        assert all(url in requested for url in urls)
+
     @pytest.mark.parametrize('station_id, variable, start, end, expected_mean', [
         ('SASP', CSASVariables.SURF_TEMP, DT_20230301, DT_20230315, -11.49969),
     ])
@@ -28,40 +28,23 @@ class TestCuesStation(BasePointDataTest):
 
     @pytest.fixture(scope="class")
     def daily_expected(self, expected_meta):
-        df = gpd.GeoDataFrame.from_dict(
-            [
-                {
-                    "datetime": pd.Timestamp("2020-03-15 08:00:00+0000", tz="UTC"),
-                    "DOWNWARD SHORTWAVE RADIATION": 95.64,
-                },
-                {
-                    "datetime": pd.Timestamp("2020-03-16 08:00:00+0000", tz="UTC"),
-                    "DOWNWARD SHORTWAVE RADIATION": 86.87,
-                },
-                {
-                    "datetime": pd.Timestamp("2020-03-17 08:00:00+0000", tz="UTC"),
-                    "DOWNWARD SHORTWAVE RADIATION": 182.23,
-                },
-
-            ],
-            geometry=[expected_meta] * 3,
+        # parse the dates in one call and build the frame from columns
+        datetimes = pd.to_datetime(
+            ["2020-03-15 08:00:00", "2020-03-16 08:00:00", "2020-03-17 08:00:00"],
+            utc=True
         )
-        df["DOWNWARD SHORTWAVE RADIATION_units"] = ["Watts/meter^2"] * len(df)
-        df["site"] = ["CUES"] * len(df)
-        df["datasource"] = ["UCSB CUES"] * len(df)
-        # needed to reorder the columns for the pd testing compare
-        df = df.filter(
-            [
-                "datetime",
-                "geometry",
-                "DOWNWARD SHORTWAVE RADIATION",
-                "site",
-                "DOWNWARD SHORTWAVE RADIATION_units",
-                "datasource",
-            ]
+        return gpd.GeoDataFrame(
+            {
+                "DOWNWARD SHORTWAVE RADIATION": [95.64, 86.87, 182.23],
+                "DOWNWARD SHORTWAVE RADIATION_units": ["Watts/meter^2"] * 3,
+                "datasource": ["UCSB CUES"] * 3,
+                "geometry": [expected_meta] * 3,
+            },
+            index=pd.MultiIndex.from_arrays(
+                [datetimes, ["CUES"] * 3], names=["datetime", "site"]
+            ),
+            geometry="geometry",
         )
-        df.set_index(keys=["datetime", "site"], inplace=True)
-        return df
 
     @classmethod
     def get_url_response(cls, resp="daily"):
@@ -115,7 +98,7 @@ class TestCuesStation(BasePointDataTest):
         assert resp["datetime"].values[-1] == pd.to_datetime("2020-04-02 07")
         assert resp["UPWARD SHORTWAVE RADIATION"].values[0] == -9.78
         assert resp["UPWARD SHORTWAVE RADIATION"].values[-1] == -8.44
-        assert all(resp["site"].values == "CUES")
+        assert resp["site"].eq("CUES").all()
 
     def test_points_from_geometry_failure(self, station):
         with pytest.raises(NotImplementedError):
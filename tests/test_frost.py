@@ -1,13 +1,13 @@
 import json
 from datetime import datetime
 from pathlib import Path
-import geopandas as gpd
 import pandas as pd
 import pytest
 from unittest.mock import patch, MagicMock
 
 from metloom.pointdata import norway
 from metloom.variables import MetNorwayVariables
+from tests.utils import read_json, read_shape_file
 
 
 class TestMetNorway:
@@ -25,9 +25,9 @@ class TestMetNorway:
             if "air_temperature" in kwargs["params"]["elements"]:
                 # Success case
                 mock_resp.status_code = 200
-                with open(cls.MOCKS_DIR.joinpath("hourly_temp.json")) as fp:
-                    obj = json.load(fp)
-                mock_resp.json.return_value = obj
+                mock_resp.json.return_value = read_json(
+                    cls.MOCKS_DIR.joinpath("hourly_temp.json")
+                )
             else:
                 # Case of no data
                 mock_resp.status_code = 412
@@ -36,14 +36,12 @@ class TestMetNorway:
         elif "sources/v0" in args[0]:
             params = kwargs["params"]
             mock_resp.status_code = 200
-            with open(cls.MOCKS_DIR.joinpath("search.json")) as fp:
-                obj = json.load(fp)
+            obj = read_json(cls.MOCKS_DIR.joinpath("search.json"))
             ids = params.get("ids")
             if ids:
-                # filter to ids
-                data = obj["data"]
-                data = [d for d in data if d["id"] in ids]
-                obj["data"] = data
+                # filter to ids without modifying the shared mock
+                data = [d for d in obj["data"] if d["id"] in ids]
+                obj = {**obj, "data": data}
 
             mock_resp.json.return_value = obj
         else:
@@ -64,23 +62,21 @@ class TestMetNorway:
         return obj
 
     @pytest.fixture(scope='session')
-    def token_file(self):
+    def token_file(self, tmp_path_factory):
         """
-        Json token file fixture for mocking having a token
+        Json token file fixture for mocking having a token. This is
+        written to a session temp dir so parallel runs don't share it
         """
         d = {
             'client_id': '####',
             'client_secret': '####'
         }
-        json_file = Path(__file__).parent.joinpath('frost_token.json')
+        json_file = tmp_path_factory.mktemp("frost").joinpath('frost_token.json')
 
         with open(json_file, 'w+') as fp:
             json.dump(d, fp)
 
-        yield json_file
-        # Clean up
-        if json_file.is_file():
-            json_file.unlink()
+        return json_file
 
     @pytest.fixture(scope="class")
     def mock_request(self):
@@ -124,9 +120,7 @@ class TestMetNorway:
         assert result is None
 
     def test_points_from_geometry(self, mock_request, token_file):
-        shp = gpd.read_file(
-            self.MOCKS_DIR.joinpath("box.shp")
-        )
+        shp = read_shape_file(self.MOCKS_DIR.joinpath("box.shp"))
         result = norway.MetNorwayPointData.points_from_geometry(
             shp, [MetNorwayVariables.TEMP], token_json=token_file
         )
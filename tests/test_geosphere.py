@@ -1,4 +1,3 @@
-import json
 from collections import OrderedDict
 from datetime import datetime, date
 from pathlib import Path
@@ -15,6 +14,7 @@ from metloom.variables import (
     GeoSphereCurrentVariables, GeoSphereHistVariables
 )
 from tests.test_point_data import BasePointDataTest
+from tests.utils import read_json
 
 
 TODAY = date.today()
@@ -22,15 +22,11 @@ TODAY = date.today()
 
 class TestGeoSphereCurrentPointData(BasePointDataTest):
     DATA_DIR = Path(__file__).parent.joinpath("data")
+    SHAPE_FILE = "austria_box.shp"
     EXPECTED_DATETIMES = pd.date_range(
         TODAY.isoformat(), periods=3, freq='H', tz='UTC'
     )
 
-    @pytest.fixture(scope="class")
-    def shape_obj(self):
-        fp = self.DATA_DIR.joinpath("austria_box.shp")
-        return gpd.read_file(fp)
-
     def _meta_response(self, *args, **kwargs):
         """
         Mccall airport station metadata return
@@ -40,10 +36,9 @@ class TestGeoSphereCurrentPointData(BasePointDataTest):
         url = args[0]
 
         if 'metadata' in url:
-            with open(
+            response = read_json(
                 self.DATA_DIR.joinpath("geosphere_mocks/meta_mock.json")
-            ) as fp:
-                response = json.load(fp)
+            )
 
         else:
             raise ValueError('Invalid test url provided')
@@ -184,11 +179,7 @@ class TestGeoSphereCurrentPointData(BasePointDataTest):
 
 class TestGeoSphereHistPointData(BasePointDataTest):
     DATA_DIR = Path(__file__).parent.joinpath("data")
-
-    @pytest.fixture(scope="class")
-    def shape_obj(self):
-        fp = self.DATA_DIR.joinpath("austria_box.shp")
-        return gpd.read_file(fp)
+    SHAPE_FILE = "austria_box.shp"
 
     def _meta_response(self, *args, **kwargs):
         """
@@ -199,10 +190,9 @@ class TestGeoSphereHistPointData(BasePointDataTest):
         url = args[0]
 
         if 'metadata' in url:
-            with open(
+            response = read_json(
                 self.DATA_DIR.joinpath("geosphere_mocks/klima_mock.json")
-            ) as fp:
-                response = json.load(fp)
+            )
 
         else:
             raise ValueError('Invalid test url provided')
@@ -1,8 +1,6 @@
 import json
-import os
 from collections import OrderedDict
 from datetime import datetime
-from os import path
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
@@ -15,31 +13,21 @@ from tests.test_point_data import BasePointDataTest
 
 
 class TestMesowestPointData(BasePointDataTest):
+    SHAPE_FILE = "triangle.shp"
+
     @pytest.fixture(scope='session')
-    def token_file(self):
+    def token_file(self, tmp_path_factory):
         """
-        Json token file fixture for mocking having a token
+        Json token file fixture for mocking having a token. This is
+        written to a session temp dir so parallel runs don't share it
         """
         d = {'token': '####'}
-        json_file = path.join(path.dirname(__file__), 'token.json')
+        json_file = tmp_path_factory.mktemp("mesowest").joinpath('token.json')
 
         with open(json_file, 'w+') as fp:
             json.dump(d, fp)
 
-        yield json_file
-        # Clean up
-        if path.isfile(json_file):
-            os.remove(json_file)
-
-    @pytest.fixture(scope="class")
-    def data_dir(self):
-        this_dir = path.dirname(__file__)
-        return path.join(this_dir, "data")
-
-    @pytest.fixture(scope="class")
-    def shape_obj(self, data_dir):
-        fp = path.join(data_dir, "triangle.shp")
-        return gpd.read_file(fp)
+        return str(json_file)
 
     def _meta_response(self, *args, **kwargs):
         """
@@ -1,4 +1,3 @@
-import json
 from os.path import join
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -11,6 +10,7 @@ from shapely.geometry import Point
 from metloom.pointdata import NWSForecastPointData
 from metloom.variables import NWSForecastVariables
 from tests.test_point_data import BasePointDataTest
+from tests.utils import read_json
 
 DATA_DIR = str(Path(__file__).parent.joinpath("data/nws_mocks"))
 
@@ -20,11 +20,9 @@ class TestNWSForecast(BasePointDataTest):
     def get_side_effect(cls, *args, **kwargs):
         url = args[0]
         if ".gov/gridpoints" in url:
-            with open(join(DATA_DIR, "meta_and_data.json")) as fp:
-                data = json.load(fp)
+            data = read_json(join(DATA_DIR, "meta_and_data.json"))
         elif ".gov/points" in url:
-            with open(join(DATA_DIR, "initial_meta.json")) as fp:
-                data = json.load(fp)
+            data = read_json(join(DATA_DIR, "initial_meta.json"))
         else:
             raise RuntimeError(f"{url} is an unknown option")
 
@@ -62,26 +60,21 @@ class TestNWSForecast(BasePointDataTest):
         temp_values = [
             26.82539683, 23.647343, 16.18357488, 14.19191919, 19.46859903,
             18.68686869, 16.06280193, 16.61835749, 27.22222222]
-        df = pd.DataFrame()
-        df["datetime"] = pd.to_datetime(dts)
-        df["AIR TEMP"] = temp_values
-        df['AIR TEMP_units'] = ["degC"] * len(df)
-        df["site"] = ["test"] * len(df)
-        df["datasource"] = ["NWS Forecast"] * len(df)
-        df = gpd.GeoDataFrame(df, geometry=[expected_meta] * len(df))
-        # needed to reorder the columns for the pd testing compare
-        df = df.filter(
-            [
-                "datetime",
-                "geometry",
-                "AIR TEMP",
-                "site",
-                "AIR TEMP_units",
-                "datasource",
-            ]
+        n_dates = len(dts)
+        # build the frame with its final columns and index in one go
+        return gpd.GeoDataFrame(
+            {
+                "AIR TEMP": temp_values,
+                "AIR TEMP_units": ["degC"] * n_dates,
+                "datasource": ["NWS Forecast"] * n_dates,
+                "geometry": [expected_meta] * n_dates,
+            },
+            index=pd.MultiIndex.from_arrays(
+                [pd.to_datetime(dts), ["test"] * n_dates],
+                names=["datetime", "site"]
+            ),
+            geometry="geometry",
         )
-        df.set_index(keys=["datetime", "site"], inplace=True)
-        return df
 
     def test_get_metadata(self, station, expected_meta):
         result = station.metadata
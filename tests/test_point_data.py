@@ -2,8 +2,10 @@ import pytest
 import geopandas as gpd
 import pandas as pd
 from os import path
+from pathlib import Path
 
 from metloom.pointdata.base import PointData, DataValidationError
+from tests.utils import read_shape_file
 
 
 def side_effect_error(*args):
@@ -18,48 +20,39 @@ class TestPointData:
 
 
 class BasePointDataTest(object):
-    @pytest.fixture(scope="class")
+    # Shapefile in the test data dir used for the shape_obj fixture
+    SHAPE_FILE = "testing.shp"
+
+    @pytest.fixture(scope="session")
     def data_dir(self):
         this_dir = path.dirname(__file__)
         return path.join(this_dir, "data")
 
-    @pytest.fixture(scope="class")
+    @pytest.fixture(scope="session")
     def shape_obj(self, data_dir):
-        fp = path.join(data_dir, "testing.shp")
-        return gpd.read_file(fp)
+        return read_shape_file(Path(data_dir).joinpath(self.SHAPE_FILE))
 
     @staticmethod
-    def expected_response(dates, variables_map, station, points,
+    def expected_response(dates, variables_map, station_id, points,
                           include_measurement_date=False):
-        obj = []
-        for idt, dt in enumerate(dates):
-            # get the value and unit corresponding to the date
-            row_obj = {k: v[idt] for k, v in variables_map.items()}
-            entry = {
-                "datetime": pd.Timestamp(dt, tz="UTC"),
-                "site": station.id,
-                "datasource": "NRCS",
-                **row_obj
-            }
-            if include_measurement_date:
-                entry["measurementDate"] = pd.Timestamp(dt, tz="UTC")
-            obj.append(
-                entry
-            )
-        df = gpd.GeoDataFrame.from_dict(
-            obj,
-            geometry=[points] * len(dates),
+        # build the frame in one pass, with its final index and sorted
+        # columns, rather than copying it to re-index and sort
+        datetimes = pd.to_datetime(dates, utc=True)
+        n_dates = len(datetimes)
+        data = {
+            "datasource": "NRCS",
+            "geometry": [points] * n_dates,
+            **variables_map
+        }
+        if include_measurement_date:
+            data["measurementDate"] = datetimes
+        index = pd.MultiIndex.from_arrays(
+            [datetimes, [station_id] * n_dates], names=["datetime", "site"]
         )
-        # needed to reorder the columns for the pd testing compare
-        var_keys = list(variables_map.keys())
-        var_keys.sort()
-        df = df.filter(
-            [
-                "datetime", "geometry", "site", "measurementDate",
-                *var_keys, "datasource"]
+        return gpd.GeoDataFrame(
+            {column: data[column] for column in sorted(data)},
+            index=index, geometry="geometry"
         )
-        df.set_index(keys=["datetime", "site"], inplace=True)
-        return df.sort_index(axis=1)
 
 
 class TestPointDataValidations:
@@ -1,206 +1,223 @@
 from datetime import timezone, timedelta, datetime
 from unittest.mock import patch, MagicMock
-from collections import OrderedDict
 
-import geopandas as gpd
 import numpy as np
 import pandas as pd
 import pytest
+from shapely.geometry import Point
 
 from metloom.pointdata import SnotelPointData
+from metloom.pointdata.snotel_client import _get_client
 from metloom.variables import SnotelVariables
 from tests.test_point_data import BasePointDataTest
 
+# Location of the Idarado (538:CO:SNTL) mock station
+IDARADO_POINT = Point(-107.67552, 37.9339, 9800.0)
+
 
 class MockZeepObject:
+    # attributes resolve from mock_dict, so there is no per-instance __dict__
+    __slots__ = ("mock_dict", "__values__")
+
     def __init__(self, obj):
         """
         Args:
             obj: dictionary of values
         """
-        self.mock_dict = OrderedDict(obj)
+        self.mock_dict = dict(obj)
         self.__values__ = self.mock_dict
-        for k, v in obj.items():
-            setattr(self, k, v)
 
-    def __dict__(self):
-        return self.mock_dict
+    def __getattr__(self, item):
+        try:
+            return self.mock_dict[item]
+        except KeyError:
+            raise AttributeError(item)
 
     def __getitem__(self, item):
         return self.mock_dict[item]
 
 
-class TestSnotelPointData(BasePointDataTest):
+# Mocked getStationMetadata results keyed on station triplet
+STATION_METADATA = {
+    "538:CO:SNTL": {
+        "actonId": "07M27S",
+        "beginDate": "1979-10-01 00:00:00",
+        "countyName": "Ouray",
+        "elevation": 9800.0,
+        "endDate": "2100-01-01 00:00:00",
+        "fipsCountryCd": "US",
+        "fipsCountyCd": "091",
+        "fipsStateNumber": "08",
+        "huc": "140200060201",
+        "hud": "14020006",
+        "latitude": 37.9339,
+        "longitude": -107.67552,
+        "name": "Idarado",
+        "shefId": "IDRC2",
+        "stationTriplet": "538:CO:SNTL",
+        "stationDataTimeZone": -8.0
+    },
+    "538:CO:SNOW": {
+        "actonId": "07M27S",
+        "beginDate": "1979-10-01 00:00:00",
+        "countyName": "Ouray",
+        "elevation": 9800.0,
+        "endDate": "2100-01-01 00:00:00",
+        "fipsCountryCd": "US",
+        "fipsCountyCd": "091",
+        "fipsStateNumber": "08",
+        "huc": "140200060201",
+        "hud": "14020006",
+        "latitude": 37.9339,
+        "longitude": -107.67552,
+        "name": "Idarado",
+        "shefId": "IDRC2",
+        "stationTriplet": "538:CO:SNOW",
+    },
+    "FFF:CA:SNOW": {
+        "actonId": None,
+        "beginDate": "1930-02-01 00:00:00",
+        "countyName": "Tuolumne",
+        "elevation": 6500.0,
+        "endDate": "2100-01-01 00:00:00",
+        "fipsCountryCd": "US",
+        "fipsCountyCd": "109",
+        "fipsStateNumber": "06",
+        "huc": "180400090302",
+        "latitude": 37.995,
+        "longitude": -119.78,
+        "name": "Fake1",
+        "shefId": None,
+        "stationTriplet": "FFF:CA:SNOW",
+    },
+    "BBB:CA:SNOW": {
+        "actonId": None,
+        "beginDate": "1948-02-01 00:00:00",
+        "countyName": "Tuolumne",
+        "elevation": 9300.0,
+        "endDate": "2100-01-01 00:00:00",
+        "fipsCountryCd": "US",
+        "fipsCountyCd": "109",
+        "fipsStateNumber": "06",
+        "huc": "180400090402",
+        "hud": "18040009",
+        "latitude": 38.18333,
+        "longitude": -119.61667,
+        "name": "Fake2",
+        "shefId": None,
+        "stationTriplet": "BBB:CA:SNOW",
+    },
+}
+# Built once at import instead of on every mocked request
+META_RESPONSES = {
+    triplet: MockZeepObject(meta)
+    for triplet, meta in STATION_METADATA.items()
+}
+# Mocked getData results keyed on duration
+DATA_RESPONSES = {
+    "SEMIMONTHLY": [
+        MockZeepObject({
+            'beginDate': '2020-01-20 00:00:00',
+            'collectionDates': ['2020-01-28', '2020-02-27'],
+            'duration': 'SEMIMONTHLY',
+            'endDate': '2020-03-14 00:00:00',
+            'flags': ['V', 'V'], 'stationTriplet': '538:CO:SNTL',
+            'values': [13.19, 13.17]})
+    ],
+    "DAILY": [
+        MockZeepObject({
+            'beginDate': '2020-03-20 00:00:00',
+            'collectionDates': [], 'duration': 'DAILY',
+            'endDate': '2020-03-22 00:00:00', 'flags': ['V', 'V', 'V'],
+            'stationTriplet': '538:CO:SNTL',
+            'values': [13.19, 13.17, 13.14]})
+    ],
+}
+# Mocked getHourlyData results keyed on element code
+HOURLY_RESPONSES = {
+    "WTEQ": [
+        {
+            'beginDate': '2020-01-02 00:00', 'endDate': '2020-01-20 00:00',
+            'stationTriplet': '538:CO:SNTL',
+            'values': [
+                {
+                    'dateTime': '2020-03-20 00:00',
+                    'flag': 'V',
+                    'value': 13.19
+                }, {
+                    'dateTime': '2020-03-20 01:00',
+                    'flag': 'V',
+                    'value': 13.17
+                }, {
+                    'dateTime': '2020-03-20 02:00',
+                    'flag': 'V',
+                    'value': 13.14
+                }]}],
+    "PRCPSA": [
+        {
+            'beginDate': '2020-01-02 00:00',
+            'endDate': '2020-01-20 00:00',
+            'stationTriplet': '538:CO:SNTL',
+            'values': [
+                {
+                    'dateTime': '2020-03-20 00:00',
+                    'flag': 'V',
+                    'value': 4.1
+                }, {
+                    'dateTime': '2020-03-20 02:00',
+                    'flag': 'V',
+                    'value': 4.3
+                }, {
+                    'dateTime': '2020-03-20 03:00',
+                    'flag': 'V',
+                    'value': 4.4
+                }]}],
+    "STO": [
+        {
+            'beginDate': '2020-01-02 00:00',
+            'endDate': '2020-01-20 00:00',
+            'stationTriplet': '538:CO:SNTL',
+            'values': [
+                {
+                    'dateTime': '2020-03-20 00:00',
+                    'flag': 'V',
+                    'value': -0.3,
+                }, {
+                    'dateTime': '2020-03-20 01:00',
+                    'flag': 'V',
+                    'value': -0.4,
+                }, {
+                    'dateTime': '2020-03-20 02:00',
+                    'flag': 'V',
+                    'value': -0.5,
+                }]}],
+}
 
-    @pytest.fixture(scope="class")
+
+class TestSnotelPointData(BasePointDataTest):
+    @pytest.fixture(scope="session")
     def points(self):
-        return gpd.points_from_xy([-107.67552], [37.9339], z=[9800.0])[0]
+        return IDARADO_POINT
 
     @staticmethod
     def snotel_meta_sideeffect(*args, **kwargs):
         """
         Mock out the metadata response
         """
-        code = kwargs["stationTriplet"]
-        available_stations = {
-            "538:CO:SNTL": {
-                "actonId": "07M27S",
-                "beginDate": "1979-10-01 00:00:00",
-                "countyName": "Ouray",
-                "elevation": 9800.0,
-                "endDate": "2100-01-01 00:00:00",
-                "fipsCountryCd": "US",
-                "fipsCountyCd": "091",
-                "fipsStateNumber": "08",
-                "huc": "140200060201",
-                "hud": "14020006",
-                "latitude": 37.9339,
-                "longitude": -107.67552,
-                "name": "Idarado",
-                "shefId": "IDRC2",
-                "stationTriplet": "538:CO:SNTL",
-                "stationDataTimeZone": -8.0
-            },
-            "538:CO:SNOW": {
-                "actonId": "07M27S",
-                "beginDate": "1979-10-01 00:00:00",
-                "countyName": "Ouray",
-                "elevation": 9800.0,
-                "endDate": "2100-01-01 00:00:00",
-                "fipsCountryCd": "US",
-                "fipsCountyCd": "091",
-                "fipsStateNumber": "08",
-                "huc": "140200060201",
-                "hud": "14020006",
-                "latitude": 37.9339,
-                "longitude": -107.67552,
-                "name": "Idarado",
-                "shefId": "IDRC2",
-                "stationTriplet": "538:CO:SNOW",
-            },
-            "FFF:CA:SNOW": {
-                "actonId": None,
-                "beginDate": "1930-02-01 00:00:00",
-                "countyName": "Tuolumne",
-                "elevation": 6500.0,
-                "endDate": "2100-01-01 00:00:00",
-                "fipsCountryCd": "US",
-                "fipsCountyCd": "109",
-                "fipsStateNumber": "06",
-                "huc": "180400090302",
-                "latitude": 37.995,
-                "longitude": -119.78,
-                "name": "Fake1",
-                "shefId": None,
-                "stationTriplet": "FFF:CA:SNOW",
-            },
-            "BBB:CA:SNOW": {
-                "actonId": None,
-                "beginDate": "1948-02-01 00:00:00",
-                "countyName": "Tuolumne",
-                "elevation": 9300.0,
-                "endDate": "2100-01-01 00:00:00",
-                "fipsCountryCd": "US",
-                "fipsCountyCd": "109",
-                "fipsStateNumber": "06",
-                "huc": "180400090402",
-                "hud": "18040009",
-                "latitude": 38.18333,
-                "longitude": -119.61667,
-                "name": "Fake2",
-                "shefId": None,
-                "stationTriplet": "BBB:CA:SNOW",
-            },
-        }
-        return MockZeepObject(available_stations[code])
+        return META_RESPONSES[kwargs["stationTriplet"]]
 
     @staticmethod
     def snotel_data_sideeffect(*args, **kwargs):
-        duration = kwargs["duration"]
-        if duration == "SEMIMONTHLY":
-            return [
-                MockZeepObject({
-                    'beginDate': '2020-01-20 00:00:00',
-                    'collectionDates': ['2020-01-28', '2020-02-27'],
-                    'duration': 'SEMIMONTHLY',
-                    'endDate': '2020-03-14 00:00:00',
-                    'flags': ['V', 'V'], 'stationTriplet': '538:CO:SNTL',
-                    'values': [13.19, 13.17]})
-            ]
-        if duration == "DAILY":
-            return [MockZeepObject({
-                'beginDate': '2020-03-20 00:00:00',
-                'collectionDates': [], 'duration': 'DAILY',
-                'endDate': '2020-03-22 00:00:00', 'flags': ['V', 'V', 'V'],
-                'stationTriplet': '538:CO:SNTL',
-                'values': [13.19, 13.17, 13.14]})]
+        return DATA_RESPONSES.get(kwargs["duration"])
 
     @staticmethod
     def snotel_hourly_sideeffect(*args, **kwargs):
         element_cd = kwargs["elementCd"]
-        if element_cd == "WTEQ":
-            return [
-                {
-                    'beginDate': '2020-01-02 00:00', 'endDate': '2020-01-20 00:00',
-                    'stationTriplet': '538:CO:SNTL',
-                    'values': [
-                        {
-                            'dateTime': '2020-03-20 00:00',
-                            'flag': 'V',
-                            'value': 13.19
-                        }, {
-                            'dateTime': '2020-03-20 01:00',
-                            'flag': 'V',
-                            'value': 13.17
-                        }, {
-                            'dateTime': '2020-03-20 02:00',
-                            'flag': 'V',
-                            'value': 13.14
-                        }]}]
-        elif element_cd == "PRCPSA":
-            return [
-                {
-                    'beginDate': '2020-01-02 00:00',
-                    'endDate': '2020-01-20 00:00',
-                    'stationTriplet': '538:CO:SNTL',
-                    'values': [
-                        {
-                            'dateTime': '2020-03-20 00:00',
-                            'flag': 'V',
-                            'value': 4.1
-                        }, {
-                            'dateTime': '2020-03-20 02:00',
-                            'flag': 'V',
-                            'value': 4.3
-                        }, {
-                            'dateTime': '2020-03-20 03:00',
-                            'flag': 'V',
-                            'value': 4.4
-                        }]}]
-        elif element_cd == "STO":
-            return [
-                {
-                    'beginDate': '2020-01-02 00:00',
-                    'endDate': '2020-01-20 00:00',
-                    'stationTriplet': '538:CO:SNTL',
-                    'values': [
-                        {
-                            'dateTime': '2020-03-20 00:00',
-                            'flag': 'V',
-                            'value': -0.3,
-                        }, {
-                            'dateTime': '2020-03-20 01:00',
-                            'flag': 'V',
-                            'value': -0.4,
-                        }, {
-                            'dateTime': '2020-03-20 02:00',
-                            'flag': 'V',
-                            'value': -0.5,
-                        }]}]
-        else:
+        if element_cd not in HOURLY_RESPONSES:
             raise ValueError(f"{element_cd} not configured in this mock")
+        return HOURLY_RESPONSES[element_cd]
 
-    @pytest.fixture(scope="class")
+    @pytest.fixture(scope="session")
     def mock_elements(self):
         return [
             MockZeepObject(
@@ -249,33 +266,57 @@ class TestSnotelPointData(BasePointDataTest):
                  'storedUnitCd': 'degF'})
         ]
 
-    @pytest.fixture
-    def mock_zeep_client(self, mock_elements):
+    @pytest.fixture(scope="class")
+    def zeep_client_patch(self):
+        """
+        Patch zeep.Client once for the class, mock_zeep_client resets it
+        """
+        # drop any client cached outside of this patch, and ours after it
+        _get_client.cache_clear()
         with patch("metloom.pointdata.snotel_client.zeep.Client") as mock_client:
-            mock_service = MagicMock()
-            # setup the individual services
-            mock_service.getStationMetadata.side_effect = self.snotel_meta_sideeffect
-            mock_service.getStationElements.return_value = mock_elements
-            mock_service.getStations.return_value = ["FFF:CA:SNOW",
-                                                     "BBB:CA:SNOW"]
-            mock_service.getData.side_effect = self.snotel_data_sideeffect
-            mock_service.getHourlyData.side_effect = self.snotel_hourly_sideeffect
-            # assign service to client
-            mock_client.return_value.service = mock_service
             yield mock_client
+        _get_client.cache_clear()
 
-    def test_metadata(self, mock_zeep_client):
+    @pytest.fixture
+    def mock_zeep_client(self, zeep_client_patch, mock_elements):
+        mock_client = zeep_client_patch
+        mock_client.reset_mock()
+        mock_service = MagicMock()
+        # setup the individual services
+        mock_service.getStationMetadata.side_effect = self.snotel_meta_sideeffect
+        mock_service.getStationElements.return_value = mock_elements
+        mock_service.getStations.return_value = ["FFF:CA:SNOW",
+                                                 "BBB:CA:SNOW"]
+        mock_service.getData.side_effect = self.snotel_data_sideeffect
+        mock_service.getHourlyData.side_effect = self.snotel_hourly_sideeffect
+        # assign service to client
+        mock_client.return_value.service = mock_service
+        return mock_client
+
+    @pytest.fixture(scope="class")
+    def station_factory(self, zeep_client_patch):
+        """
+        Build one SnotelPointData per station id for the class. Stations
+        only cache metadata and elements from the mocked client, so the
+        data tests can share them
+        """
+        stations = {}
+
+        def make(station_id):
+            if station_id not in stations:
+                stations[station_id] = SnotelPointData(station_id, "TestSite")
+            return stations[station_id]
+        return make
+
+    def test_metadata(self, mock_zeep_client, points):
         obj = SnotelPointData("538:CO:SNTL", "eh")
-        assert (
-            obj.metadata == gpd.points_from_xy(
-                [-107.67552], [37.9339], z=[9800.0])[0]
-        )
+        assert obj.metadata == points
         assert obj.tzinfo == timezone(timedelta(hours=-8.0))
 
     @pytest.mark.parametrize(
         "station_id, dts, expected_dts, vals, d1, d2, fn_name",
         [
-            (
+            pytest.param(
                 "538:CO:SNTL",
                 ["2020-03-20 00:00", "2020-03-20 01:00", "2020-03-20 02:00"],
                 ["2020-03-20 08:00", "2020-03-20 09:00", "2020-03-20 10:00"],
@@ -286,8 +327,9 @@ class TestSnotelPointData(BasePointDataTest):
                 datetime(2020, 3, 20, 0),
                 datetime(2020, 3, 20, 2),
                 "get_hourly_data",
+                id="hourly_swe",
             ),
-            (
+            pytest.param(
                 "538:CO:SNTL",
                 ["2020-03-20 00:00", "2020-03-20 01:00", "2020-03-20 02:00"],
                 ["2020-03-20 08:00", "2020-03-20 09:00", "2020-03-20 10:00"],
@@ -299,8 +341,9 @@ class TestSnotelPointData(BasePointDataTest):
                 datetime(2020, 3, 20, 0),
                 datetime(2020, 3, 20, 2),
                 "get_hourly_data",
+                id="hourly_ground_temp",
             ),
-            (
+            pytest.param(
                 "538:CO:SNTL",
                 ["2020-03-20", "2020-03-21", "2020-03-22"],
                 ["2020-03-20 08:00", "2020-03-21 08:00", "2020-03-22 08:00"],
@@ -311,8 +354,9 @@ class TestSnotelPointData(BasePointDataTest):
                 datetime(2020, 3, 20),
                 datetime(2020, 3, 22),
                 "get_daily_data",
+                id="daily_swe",
             ),
-            (
+            pytest.param(
                 "538:CO:SNOW",
                 ["2020-01-28", "2020-02-27"],
                 ["2020-01-28 00:00", "2020-02-27 00:00"],
@@ -323,13 +367,14 @@ class TestSnotelPointData(BasePointDataTest):
                 datetime(2020, 1, 20),
                 datetime(2020, 3, 15),
                 "get_snow_course_data",
+                id="snow_course_swe",
             ),
-        ],
+        ]
     )
     def test_get_data_methods(
             self, station_id, dts, expected_dts, vals, d1,
-            d2, fn_name, points, mock_zeep_client):
-        station = SnotelPointData(station_id, "TestSite")
+            d2, fn_name, mock_zeep_client, station_factory, points):
+        station = station_factory(station_id)
         if 'GROUND TEMPERATURE -2IN' in list(vals.keys()):
             vrs = [SnotelVariables.TEMPGROUND2IN]
         else:
@@ -337,12 +382,10 @@ class TestSnotelPointData(BasePointDataTest):
         fn = getattr(station, fn_name)
         result = fn(d1, d2, vrs)
         expected = self.expected_response(
-            expected_dts, vals, station, points,
+            expected_dts, vals, station_id, points,
             include_measurement_date="snow_course" in fn_name
         )
-        pd.testing.assert_frame_equal(
-            result.sort_index(axis=1), expected
-        )
+        pd.testing.assert_frame_equal(result, expected, check_like=True)
 
     def test_get_hourly_data_multi_sensor(self, points, mock_zeep_client):
         expected_dts = [
@@ -362,11 +405,9 @@ class TestSnotelPointData(BasePointDataTest):
             datetime(2020, 3, 20, 0), datetime(2020, 3, 20, 4), vrs
         )
         expected = self.expected_response(
-            expected_dts, expected_vals_obj, station, points
-        )
-        pd.testing.assert_frame_equal(
-            result.sort_index(axis=1), expected
+            expected_dts, expected_vals_obj, station.id, points
         )
+        pd.testing.assert_frame_equal(result, expected, check_like=True)
 
     def test_points_from_geometry(self, shape_obj, mock_zeep_client):
         result = SnotelPointData.points_from_geometry(
@@ -3,41 +3,59 @@ Tests our snowex reader which is pulling down csv data from the nsidc
 All mock data is cut to the first 2 weeks of january in 2017. 2018 for GMSP
 
 """
+import os
 import shutil
 import pytest
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
-import geopandas as gpd
 from unittest.mock import patch
 
 from metloom.variables import SnowExVariables
 from metloom.pointdata import SnowExMet
+from tests.utils import read_shape_file
 
 
-DATA_DIR = str(Path(__file__).parent.joinpath("data/snowex_mocks"))
+DATA_DIR = Path(__file__).parent.joinpath("data/snowex_mocks")
 
 
 class TestSnowEx:
-    def copy_file(self, urls):
+    def copy_file(self, staging, cache, urls):
         files = []
         for url in urls:
-            file = Path(DATA_DIR).joinpath(Path(url).name)
-            cache = Path(__file__).parent.joinpath('cache')
-            shutil.copy(file, cache.joinpath(file.name))
-            files.append(file)
+            file = staging.joinpath(Path(url).name)
+            cached = cache.joinpath(file.name)
+            if not cached.exists():
+                try:
+                    # The tests only read the csv so a link is enough
+                    os.link(file, cached)
+                except OSError:
+                    shutil.copyfile(file, cached)
+            files.append(cached)
         return files
 
+    @pytest.fixture(scope='session')
+    def snowex_staging(self, tmp_path_factory):
+        """Copy of the mock csvs, made once and linked into each cache"""
+        staging = tmp_path_factory.mktemp('snowex')
+        for file in DATA_DIR.glob('*.csv'):
+            shutil.copyfile(file, staging.joinpath(file.name))
+        return staging
+
+    @pytest.fixture(scope='session')
+    def gm_polygon(self):
+        """Grand Mesa search polygon, read once"""
+        return read_shape_file(DATA_DIR.joinpath('gm_polygon.shp'))
+
     @pytest.fixture(scope='function')
-    def cache_dir(self):
-        """Cachae dir where data is being downloaded to"""
-        cache = Path(__file__).parent.joinpath('cache')
-        yield cache
-        if cache.is_dir():
-            shutil.rmtree(cache)
+    def cache_dir(self, tmp_path):
+        """Cache dir where data is being downloaded to"""
+        return tmp_path
 
     @pytest.fixture(scope='function')
-    def station(self, cache_dir, station_id):
-        with patch.object(SnowExMet, '_download', new=self.copy_file):
+    def station(self, cache_dir, snowex_staging, station_id):
+        download = partial(self.copy_file, snowex_staging, cache_dir)
+        with patch.object(SnowExMet, '_download', new=download):
             pnt = SnowExMet(station_id, cache=cache_dir)
             yield pnt
 
@@ -99,10 +117,9 @@ class TestSnowEx:
         # Test Buffer use
         (True, 0.1, 4)
     ])
-    def test_within_geometry(self, within_geom, buffer, expected_count):
+    def test_within_geometry(self, gm_polygon, within_geom, buffer, expected_count):
         """ Use the within geometry on downloaded stations """
-        search_poly = gpd.read_file(Path(DATA_DIR).joinpath('gm_polygon.shp'))
-        df = SnowExMet.points_from_geometry(search_poly,
+        df = SnowExMet.points_from_geometry(gm_polygon,
                                             [SnowExVariables.TEMP_20FT],
                                             within_geometry=within_geom,
                                             buffer=buffer)
@@ -1,158 +1,180 @@
 from datetime import datetime
-from os.path import join
+from functools import lru_cache
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
-import json
 
 import geopandas as gpd
 import pandas as pd
 import pytest
+import requests
+from shapely.geometry import Point
 
 from metloom.pointdata import USGSPointData
+from metloom.pointdata.usgs import SESSION
 from metloom.variables import USGSVariables
 from tests.test_point_data import BasePointDataTest
+from tests.utils import read_json, read_text
 
-DATA_DIR = str(Path(__file__).parent.joinpath("data/usgs_mocks"))
+DATA_DIR = Path(__file__).parent.joinpath("data/usgs_mocks")
+# Location of the Conejos R bl Platoro Reservoir (08245000) mock station
+CRP_POINT = Point(-106.54, 37.35, 9866.6)
+# Geometry column of the two day CRP expected frame
+CRP_GEOMETRY = gpd.GeoSeries([CRP_POINT, CRP_POINT]).values
+# Body of the 404 page USGS returns when a search finds no sites
+FAILURE_CONTENT = (
+    b'<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Strict//EN" '
+    b'"http://www.w3.org/TR/xhtml1/DTD/xhtml1-strict.dtd"><html xmlns='
+    b'"http://www.w3.org/1999/xhtml"><head><title>Error report</title>'
+    b'<style type="text/css"><!--H1 {font-family:Tahoma,Arial,sans-serif;'
+    b'color:white;background-color:#525D76;font-size:22px;} H2 {font-family'
+    b':Tahoma,Arial,sans-serif;color:white;background-color:#525D76;font-'
+    b'size:16px;} H3 {font-family:Tahoma,Arial,sans-serif;color:white;'
+    b'background-color:#525D76;font-size:14px;} BODY {font-family:Tahoma,'
+    b'Arial,sans-serif;color:black;background-color:white;} B {font-family:'
+    b'Tahoma,Arial,sans-serif;color:white;background-color:#525D76;} P '
+    b'{font-family:Tahoma,Arial,sans-serif;background:white;color:black;'
+    b'font-size:12px;}A {color : black;}HR {color : #525D76;}--></style> '
+    b'</head><body><h1>HTTP Status 404 - No sites found matching this '
+    b'request, server=[sdas01]</h1><hr/><p><b>type</b> Status report</p>'
+    b'<p><b>message</b>No sites found matching this request, server='
+    b'[sdas01]</p><p><b>description</b>The requested resource is not '
+    b'available.</p><hr/><h3>Error Report</h3></body></html>'
+)
+FAILURE_RESPONSE = SimpleNamespace(status_code=404, content=FAILURE_CONTENT)
+# First and last hours of the resampled 2023-01-13 (local) hourly mock data
+HOURLY_START = pd.Timestamp("2023-01-13 07:00", tz="UTC")
+HOURLY_END = pd.Timestamp("2023-01-14 06:00", tz="UTC")
+# Request params expected for the CRP daily discharge in test_get_daily_data
+DAILY_PARAMS = {
+    "startDT": "2020-07-01",
+    "endDT": "2020-07-02",
+    "sites": "08245000",
+    "format": "json",
+    "siteStatus": "all",
+    "parameterCd": "00060",
+}
 
 
 class TestUSGSStation(BasePointDataTest):
+    # Kind of mock response returned for each requested url
+    CRP_RESPONSES = {
+        USGSPointData.META_URL: "metadata",
+        USGSPointData.USGS_URL + "dv/": "daily",
+        USGSPointData.USGS_URL + "iv/": "hourly",
+    }
 
     @staticmethod
     def station_search_response():
-        with open(join(DATA_DIR, "station_search_response.txt")) as fp:
-            data_text = fp.read()
+        return read_text(DATA_DIR.joinpath("station_search_response.txt"))
 
-        return data_text
-
-    @pytest.fixture(scope="function")
+    @pytest.fixture(scope="session")
     def crp_station(self):
+        # Only caches metadata from the mocked responses, so it can be shared
         return USGSPointData("08245000", "Conejos R bl Platoro Reservoir")
 
-    @pytest.fixture(scope="class")
+    @pytest.fixture(scope="session")
     def crp_daily_expected(self):
-        points = gpd.points_from_xy([-106.54], [37.35], z=[9866.6])
-        df = gpd.GeoDataFrame.from_dict(
-            [
-                {
-                    "datetime": pd.Timestamp("2020-07-01 07:00:00+0000", tz="UTC"),
-                    "DISCHARGE": 721.0,
-                    "DISCHARGE_units": "ft3/s",
-                    "site": "08245000",
-                    "datasource": "USGS",
-                },
-                {
-                    "datetime": pd.Timestamp("2020-07-02 07:00:00+0000", tz="UTC"),
-                    "DISCHARGE": 664.0,
-                    "DISCHARGE_units": "ft3/s",
-                    "site": "08245000",
-                    "datasource": "USGS",
-                },
-
-            ],
-            geometry=[points[0]] * 2,
+        # columns are given already sorted for the pd testing compare
+        return gpd.GeoDataFrame(
+            {
+                "DISCHARGE": [721.0, 664.0],
+                "DISCHARGE_units": ["ft3/s", "ft3/s"],
+                "datasource": ["USGS", "USGS"],
+                "geometry": CRP_GEOMETRY,
+            },
+            index=pd.MultiIndex.from_arrays(
+                [
+                    pd.to_datetime(
+                        ["2020-07-01 07:00:00", "2020-07-02 07:00:00"], utc=True
+                    ),
+                    ["08245000", "08245000"],
+                ],
+                names=["datetime", "site"]
+            ),
+            geometry="geometry",
         )
-        # needed to reorder the columns for the pd testing compare
-        df = df.filter(
-            [
-                "datetime",
-                "geometry",
-                "DISCHARGE",
-                "site",
-                "DISCHARGE_units",
-                "datasource",
-            ]
-        )
-        df.set_index(keys=["datetime", "site"], inplace=True)
-        return df
-
-    @staticmethod
-    def failure_response():
-        class Response:
-            status_code = 404
-            content = (
-                b'<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Strict//EN" '
-                b'"http://www.w3.org/TR/xhtml1/DTD/xhtml1-strict.dtd"><html xmlns='
-                b'"http://www.w3.org/1999/xhtml"><head><title>Error report</title>'
-                b'<style type="text/css"><!--H1 {font-family:Tahoma,Arial,sans-serif;'
-                b'color:white;background-color:#525D76;font-size:22px;} H2 {font-family'
-                b':Tahoma,Arial,sans-serif;color:white;background-color:#525D76;font-'
-                b'size:16px;} H3 {font-family:Tahoma,Arial,sans-serif;color:white;'
-                b'background-color:#525D76;font-size:14px;} BODY {font-family:Tahoma,'
-                b'Arial,sans-serif;color:black;background-color:white;} B {font-family:'
-                b'Tahoma,Arial,sans-serif;color:white;background-color:#525D76;} P '
-                b'{font-family:Tahoma,Arial,sans-serif;background:white;color:black;'
-                b'font-size:12px;}A {color : black;}HR {color : #525D76;}--></style> '
-                b'</head><body><h1>HTTP Status 404 - No sites found matching this '
-                b'request, server=[sdas01]</h1><hr/><p><b>type</b> Status report</p>'
-                b'<p><b>message</b>No sites found matching this request, server='
-                b'[sdas01]</p><p><b>description</b>The requested resource is not '
-                b'available.</p><hr/><h3>Error Report</h3></body></html>')
-
-        return Response
 
     @classmethod
     def get_url_response(cls, resp="daily"):
+        # files are read and parsed once, then shared
         if resp == 'daily':
-            with open(join(DATA_DIR, "daily_response.txt")) as fp:
-                data = json.load(fp)
+            data = read_json(DATA_DIR.joinpath("daily_response.txt"))
         elif resp == 'metadata':
-            with open(join(DATA_DIR, "platoro_meta.txt")) as fp:
-                data = fp.read()
+            data = read_text(DATA_DIR.joinpath("platoro_meta.txt"))
         elif resp == 'hourly':
-            with open(join(DATA_DIR, "hourly_response.json")) as fp:
-                data = json.load(fp)
+            data = read_json(DATA_DIR.joinpath("hourly_response.json"))
         else:
             raise RuntimeError(f"{resp} is an unknown option")
 
         return data
 
-    def test_get_metadata(self, crp_station):
-        with patch("metloom.pointdata.usgs.USGSPointData._get_url_response") \
-                as mock_request:
-            mock_request.return_value = self.get_url_response(resp="metadata")
-            metadata = crp_station.metadata
-
-        expected = gpd.points_from_xy([-106.54], [37.35], z=[9866.6])[0]
-        assert expected == metadata
-
-    def test_get_daily_data(self, crp_station, crp_daily_expected):
-        with patch("metloom.pointdata.usgs.USGSPointData._get_url_response") \
-                as mock_requests:
-            mock_requests.side_effect = [
-                self.get_url_response(),
-                self.get_url_response(resp='metadata')
-            ]
-            response = crp_station.get_daily_data(
-                datetime(2020, 7, 1),
-                datetime(2020, 7, 2),
-                [USGSVariables.DISCHARGE],
-            )
+    @classmethod
+    @lru_cache(maxsize=None)
+    def mock_response(cls, resp):
+        """
+        Stand-in for a successful requests.Response, built once per
+        kind of response
+        """
+        data = cls.get_url_response(resp=resp)
+        if resp == "metadata":
+            return SimpleNamespace(status_code=200, text=data)
+        return SimpleNamespace(status_code=200, json=lambda: data)
+
+    @classmethod
+    def crp_side_effect(cls, url, params=None):
+        return cls.mock_response(cls.CRP_RESPONSES[url])
+
+    @pytest.fixture(scope="function")
+    def mocked_requests(self):
+        with patch("metloom.pointdata.usgs.SESSION.get") as mock_get:
+            mock_get.side_effect = self.crp_side_effect
+            yield mock_get
+
+    def test_get_metadata(self, mocked_requests):
+        # A fresh station, since crp_station may already have its metadata
+        station = USGSPointData("08245000", "Conejos R bl Platoro Reservoir")
+        assert CRP_POINT == station.metadata
+        mocked_requests.assert_called_once_with(
+            USGSPointData.META_URL,
+            params={
+                "format": "rdb",
+                "sites": "08245000",
+                "siteOutput": "expanded",
+                "siteStatus": "all",
+            }
+        )
+
+    def test_get_daily_data(
+        self, crp_station, crp_daily_expected, mocked_requests
+    ):
+        response = crp_station.get_daily_data(
+            datetime(2020, 7, 1),
+            datetime(2020, 7, 2),
+            [USGSVariables.DISCHARGE],
+        )
         pd.testing.assert_frame_equal(
-            response.sort_index(axis=1),
-            crp_daily_expected.sort_index(axis=1)
+            response, crp_daily_expected, check_like=True
+        )
+        mocked_requests.assert_any_call(
+            USGSPointData.USGS_URL + "dv/", params=DAILY_PARAMS
         )
 
-    def test_get_hourly_data(self, crp_station, crp_daily_expected):
+    def test_get_hourly_data(self, crp_station, mocked_requests):
         """
         Test that we resample from 15m to 1 hour correctly
         """
-        with patch("metloom.pointdata.usgs.USGSPointData._get_url_response") \
-                as mock_requests:
-            mock_requests.side_effect = [
-                self.get_url_response(resp='hourly'),
-                self.get_url_response(resp='metadata')
-            ]
-            response = crp_station.get_hourly_data(
-                datetime(2023, 1, 13),
-                datetime(2023, 1, 13),
-                [USGSVariables.DISCHARGE],
-            )
-        response = response.reset_index()
-        assert response["datetime"].values[0] == pd.to_datetime("2023-01-13 07")
-        assert response["datetime"].values[-1] == pd.to_datetime("2023-01-14 06")
-        assert response["DISCHARGE"].values[0] == 300.0
-        assert response["DISCHARGE"].values[-1] == 283.25
-        assert all(response["site"].values == "08245000")
+        response = crp_station.get_hourly_data(
+            datetime(2023, 1, 13),
+            datetime(2023, 1, 13),
+            [USGSVariables.DISCHARGE],
+        )
+        datetimes = response.index.get_level_values("datetime")
+        assert datetimes[0] == HOURLY_START
+        assert datetimes[-1] == HOURLY_END
+        assert response["DISCHARGE"].iat[0] == 300.0
+        assert response["DISCHARGE"].iat[-1] == 283.25
+        assert (response.index.get_level_values("site") == "08245000").all()
 
     def test_points_from_geometry(self, shape_obj):
         expected_url = (
@@ -165,22 +187,68 @@ class TestUSGSStation(BasePointDataTest):
             'MILL C BL LUNDY LK NR LEE VINING CA',
             'LEE VINING C BL SADDLEBAG LK NR LEE VINING CA'
         ]
-        with patch("metloom.pointdata.usgs.USGSPointData._get_url_response") as mock_tb:
-            mock_tb.return_value = self.station_search_response()
+        with patch("metloom.pointdata.usgs.SESSION.get") as mock_get:
+            mock_get.return_value = SimpleNamespace(
+                status_code=200, text=self.station_search_response()
+            )
             result = USGSPointData.points_from_geometry(
                 shape_obj, [USGSVariables.DISCHARGE]
             )
-            assert mock_tb.call_args[0][0] == expected_url
+            assert mock_get.call_args[0][0] == expected_url
             assert len(result) == 10
             assert [x.name in names for x in result.points]
 
+    def test_points_from_geometry_multi_variable(self, shape_obj):
+        """
+        Test the searches for each variable are combined in the order of the
+        variables, whichever finishes first
+        """
+        # Same stations for the second variable, but listed in reverse
+        lines = self.station_search_response().splitlines()
+        n_header = next(
+            i for i, line in enumerate(lines) if line.startswith("5s")
+        ) + 1
+        reversed_response = "\n".join(
+            lines[:n_header] + lines[n_header:][::-1]
+        )
+        responses = {
+            USGSVariables.DISCHARGE.code: self.station_search_response(),
+            USGSVariables.STREAMFLOW.code: reversed_response,
+        }
+
+        sessions = []
+
+        def side_effect(url, params=None, parse="text", session=None):
+            sessions.append(session)
+            return responses[url.split("parameterCd=")[-1]]
+
+        with patch(
+            "metloom.pointdata.usgs.USGSPointData._get_url_response"
+        ) as mock_get:
+            mock_get.side_effect = side_effect
+            result = USGSPointData.points_from_geometry(
+                shape_obj, [USGSVariables.DISCHARGE, USGSVariables.STREAMFLOW]
+            )
+            requested = sorted(
+                c[0][0].split("parameterCd=")[-1] for c in mock_get.call_args_list
+            )
+            assert requested == ["00060", "74082"]
+            assert [x.id for x in result.points] == [
+                "10287069", "10287655", "10287720", "10287770", "10289000",
+                "10289500", "10290500", "11265000", "11274790", "11276500"
+            ]
+        # each worker thread searches with its own session
+        assert all(isinstance(s, requests.Session) for s in sessions)
+        assert len({id(s) for s in sessions}) == 2
+        assert SESSION not in sessions
+
     def test_points_from_geometry_failure(self, shape_obj):
         expected_url = (
             'https://waterservices.usgs.gov/nwis/site/?format=rdb&bBox=-119.8%2C37.7'
             '%2C-119.2%2C38.2&siteStatus=active&hasDataTypeCd=dv,iv&parameterCd=74082'
         )
-        with patch("metloom.pointdata.usgs.requests.get") as mock_request:
-            mock_request.return_value = self.failure_response()
+        with patch("metloom.pointdata.usgs.SESSION.get") as mock_request:
+            mock_request.return_value = FAILURE_RESPONSE
             result = USGSPointData.points_from_geometry(
                 shape_obj, [USGSVariables.STREAMFLOW]
             )
@@ -192,8 +260,8 @@ class TestUSGSStation(BasePointDataTest):
             "No data: HTTP Status 404 - No sites found matching this request, "
             "server=[sdas01]"
         )
-        with patch("metloom.pointdata.usgs.requests.get") as mock_request:
-            mock_request.return_value = self.failure_response()
+        with patch("metloom.pointdata.usgs.SESSION.get") as mock_request:
+            mock_request.return_value = FAILURE_RESPONSE
             point = USGSPointData("123", "test")
             result = point._get_url_response("test")
             assert result == []
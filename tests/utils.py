@@ -0,0 +1,51 @@
+"""
+Helpers shared by the test modules
+"""
+import json
+from functools import lru_cache
+from pathlib import Path
+
+import geopandas as gpd
+
+
+@lru_cache(maxsize=None)
+def read_json(file):
+    """
+    Parse a json mock file once per session. The result is shared between
+    callers, so treat it as read only and copy before modifying it.
+
+    Args:
+        file: path to the json file
+    Returns:
+        parsed json object
+    """
+    return json.loads(Path(file).read_bytes())
+
+
+@lru_cache(maxsize=None)
+def read_text(file):
+    """
+    Read a text mock file once per session.
+
+    Args:
+        file: path to the text file
+    Returns:
+        file contents as a str
+    """
+    with open(file) as fp:
+        return fp.read()
+
+
+@lru_cache(maxsize=None)
+def read_shape_file(file):
+    """
+    Read a test shapefile once per session. The result is shared between
+    callers, so treat it as read only. Only the geometry is used, so
+    attribute fields are skipped.
+
+    Args:
+        file: pathlib.Path to the shapefile, so cache keys match
+    Returns:
+        GeoDataFrame of the shapes
+    """
+    return gpd.read_file(file, include_fields=[])